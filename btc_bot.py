@@ -4,20 +4,33 @@ BTC Accumulation Bot - BTCMarkets API v3 Compliant (FIXED)
 Fixed all API response format issues based on official documentation
 """
 
+import atexit
 import base64
-import hashlib
 import hmac
 import time
 import json
 import logging
+import logging.handlers
+import queue
 from dotenv import load_dotenv
 import os
 import requests
-import numpy as np
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Tuple, Optional
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional: it parses raw response bytes several times faster than stdlib json
+# and serialises straight to compact UTF-8 bytes
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')  # Compact JSON
 
 # Load variables from .env into os.environ
 load_dotenv()
@@ -52,43 +65,147 @@ class Config:
         return True
 
 
-# Setup logging
+# Setup logging - callers only enqueue records; a QueueListener thread does the
+# formatting and file/console writes, and is drained at exit
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler(f'logs/btc_bot_{datetime.now().strftime("%Y%m%d")}.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'logs/btc_bot_{datetime.now().strftime("%Y%m%d")}.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Final formatting happens in the listener's handlers
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+# Strategy table: Mayer Multiple bucket (rows) x Fear & Greed bucket (columns).
+# Plain tuples + bisect keep numpy off the import path; it is only loaded where arrays are built.
+# Mayer buckets: <0.8, <1.0, <1.2, <=1.6, <=2.4, >2.4 - the lower edges are '<' cut-offs
+# (bisect_right) and the upper edges '>' cut-offs (bisect_left); the bucket is the sum of both.
+MAYER_LOWER_EDGES = (0.8, 1.0, 1.2)
+MAYER_UPPER_EDGES = (1.6, 2.4)
+# Fear & Greed buckets: <25, <30, <35, <40, >=40
+FEAR_GREED_EDGES = (25, 30, 35, 40)
+
+STRATEGY_TABLE = (
+    # F&G: <25  <30  <35  <40  >=40
+    (4.0, 3.5, 3.5, 3.0, 3.0),  # Mayer < 0.8
+    (2.5, 2.5, 1.8, 1.8, 1.8),  # Mayer < 1.0
+    (1.2, 1.2, 1.2, 1.2, 1.0),  # Mayer < 1.2
+    (1.0, 1.0, 1.0, 1.0, 1.0),  # Mayer <= 1.6
+    (0.2, 0.2, 0.2, 0.2, 0.2),  # Mayer <= 2.4
+    (0.0, 0.0, 0.0, 0.0, 0.0),  # Mayer > 2.4
+)
+
+# Signal templates, formatted once per run with (mayer, fear_greed)
+SIGNALS = (
+    "🚀 PERFECT STORM: Mayer {0:.3f} + F&G {1}",              # 0
+    "🔥 EXTREME OVERSOLD + FEAR: Mayer {0:.3f} + F&G {1}",    # 1
+    "🔥 EXTREME OVERSOLD: Mayer {0:.3f}",                     # 2
+    "💎 UNDERSOLD + FEAR: Mayer {0:.3f} + F&G {1}",           # 3
+    "📈 UNDERSOLD: Mayer {0:.3f}",                            # 4
+    "⚖️ FAIR VALUE + FEAR: Mayer {0:.3f} + F&G {1}",          # 5
+    "⚖️ FAIR VALUE: Mayer {0:.3f}",                           # 6
+    "⚠️ OVERBOUGHT: Mayer {0:.3f}",                           # 7
+    "🛑 EXTREME BUBBLE: Mayer {0:.3f} - STOP buying",         # 8
 )
 
+# Index into SIGNALS for each STRATEGY_TABLE cell
+SIGNAL_TABLE = (
+    # F&G: <25 <30 <35 <40 >=40
+    (0, 1, 1, 2, 2),  # Mayer < 0.8
+    (3, 3, 4, 4, 4),  # Mayer < 1.0
+    (5, 5, 5, 5, 6),  # Mayer < 1.2
+    (6, 6, 6, 6, 6),  # Mayer <= 1.6
+    (7, 7, 7, 7, 7),  # Mayer <= 2.4
+    (8, 8, 8, 8, 8),  # Mayer > 2.4
+)
+
+
+def _strategy_bucket(mayer: float, fear_greed: int) -> Tuple[int, int]:
+    """Map a (mayer, fear_greed) observation to its (row, column) in STRATEGY_TABLE"""
+    return (bisect_right(MAYER_LOWER_EDGES, mayer) + bisect_left(MAYER_UPPER_EDGES, mayer),
+            bisect_right(FEAR_GREED_EDGES, fear_greed))
+
+
+def _bucket_multiplier(bucket: Tuple[int, int]) -> float:
+    """Buy multiplier for a (row, column) bucket from _strategy_bucket"""
+    m_idx, fg_idx = bucket
+    return STRATEGY_TABLE[m_idx][fg_idx]
 
-class BTCMarketsClient:
-    """Official BTCMarkets Python client implementation"""
+
+def _bucket_signal(bucket: Tuple[int, int], mayer: float, fear_greed: int) -> str:
+    """Signal text for a (row, column) bucket from _strategy_bucket"""
+    m_idx, fg_idx = bucket
+    return SIGNALS[SIGNAL_TABLE[m_idx][fg_idx]].format(mayer, fear_greed)
+
+
+def _multiplier(mayer: float, fear_greed: int) -> float:
+    """Buy multiplier for a single (mayer, fear_greed) observation"""
+    return _bucket_multiplier(_strategy_bucket(mayer, fear_greed))
+
+
+def _multiplier_vec(mayers, fear_greeds):
+    """Vectorised _multiplier over arrays of observations (e.g. for backtesting)"""
+    import numpy as np
+
+    # The same comparisons bisect makes, so NaN lands in the scalar path's bucket
+    # (np.searchsorted would sort it past every edge instead)
+    mayers = np.asarray(mayers, dtype=np.float64)[..., None]
+    fear_greeds = np.asarray(fear_greeds)[..., None]
+    m_idx = (~(mayers < MAYER_LOWER_EDGES)).sum(axis=-1) + (mayers > MAYER_UPPER_EDGES).sum(axis=-1)
+    fg_idx = (~(fear_greeds < FEAR_GREED_EDGES)).sum(axis=-1)
+    return np.asarray(STRATEGY_TABLE)[m_idx, fg_idx]
+
+
+class BTCMarketsReadClient:
+    """Official BTCMarkets Python client implementation - the calls the bot's run() needs"""
 
     def __init__(self, api_key, private_key):
         self.base_url = 'https://api.btcmarkets.net'
         self.api_key = api_key
         self.private_key = base64.b64decode(private_key)
 
+        # Single keep-alive session so every call reuses one TCP+TLS connection.
+        # Transient failures are retried with backoff; POST is left out so a market
+        # buy is never resent (connect failures are still retried - nothing was sent).
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=['GET', 'DELETE'], raise_on_status=False)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+
     def get_ticker(self, market_id='BTC-AUD'):
         """Get ticker for specific market"""
-        return self.__make_http_call('GET', self.api_key, self.private_key, f'/v3/markets/{market_id}/ticker', None)
+        return self._make_http_call('GET', self.api_key, self.private_key, f'/v3/markets/{market_id}/ticker', None)
 
     def get_candles(self, market_id='BTC-AUD', timeWindow='1d', limit=200):
         """Get historical candle data"""
         query_string = f'timeWindow={timeWindow}&limit={limit}'
-        return self.__make_http_call('GET', self.api_key, self.private_key, f'/v3/markets/{market_id}/candles',
-                                     query_string)
+        return self._make_http_call('GET', self.api_key, self.private_key, f'/v3/markets/{market_id}/candles',
+                                    query_string)
+
+    def get_candle_closes(self, market_id='BTC-AUD', timeWindow='1d', limit=200):
+        """Get candle closing prices as a float64 array (API error dicts are returned as-is)"""
+        candles = self.get_candles(market_id, timeWindow, limit)
+        if not isinstance(candles, list):
+            return candles
+
+        import numpy as np
+
+        # Only the close column (index 4) is needed; skip building the other 5 fields
+        return np.array([candle[4] for candle in candles[:limit]], dtype=np.float64)
 
     def get_account_balances(self):
         """Get account balances"""
-        return self.__make_http_call('GET', self.api_key, self.private_key, '/v3/accounts/me/balances', '')
-
-    def get_orders(self, status='all'):
-        """Get orders with optional status filter"""
-        query_string = f'status={status}' if status else ''
-        return self.__make_http_call('GET', self.api_key, self.private_key, '/v3/orders', query_string)
+        return self._make_http_call('GET', self.api_key, self.private_key, '/v3/accounts/me/balances', '')
 
     def place_market_buy_order(self, market_id, amount):
         """Place a market buy order
@@ -103,28 +220,12 @@ class BTCMarketsClient:
             'type': 'Market',
             'side': 'Bid'  # Bid = Buy, Ask = Sell
         }
-        return self.__make_http_call('POST', self.api_key, self.private_key, '/v3/orders', None, payload)
-
-    def place_limit_buy_order(self, market_id, amount, price):
-        """Place a limit buy order"""
-        payload = {
-            'marketId': market_id,
-            'price': str(price),
-            'amount': str(amount),
-            'type': 'Limit',
-            'side': 'Bid'
-        }
-        return self.__make_http_call('POST', self.api_key, self.private_key, '/v3/orders', None, payload)
+        return self._make_http_call('POST', self.api_key, self.private_key, '/v3/orders', None, payload)
 
-    def cancel_order(self, order_id):
-        """Cancel an order by ID"""
-        query_string = f'id={order_id}'
-        return self.__make_http_call('DELETE', self.api_key, self.private_key, '/v3/orders', query_string)
-
-    def __make_http_call(self, method, apiKey, privateKey, path, queryString, data=None):
+    def _make_http_call(self, method, apiKey, privateKey, path, queryString, data=None):
         """Make HTTP call to BTCMarkets API"""
         if data is not None:
-            data = json.dumps(data, separators=(',', ':'))  # Compact JSON
+            data = json_dumps(data)  # Compact JSON bytes, used for both signing and the body
 
         headers = self.___build_headers(method, apiKey, privateKey, path, data)
 
@@ -134,42 +235,41 @@ class BTCMarketsClient:
             full_path = path + '?' + queryString
 
         try:
-            http_request = Request(self.base_url + full_path, None, headers, method=method)
-
-            if method == 'POST' or method == 'PUT':
-                if data:
-                    response = urlopen(http_request, data=bytes(data, encoding="utf-8"))
-                else:
-                    response = urlopen(http_request)
-            else:
-                response = urlopen(http_request)
+            response = self.session.request(method, self.base_url + full_path, headers=headers,
+                                            data=data, timeout=10)
+
+            if not response.ok:
+                try:
+                    error_data = json_loads(response.content)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    error_data = None
+
+                # Non-JSON or non-object error bodies fall back to the HTTP status line
+                if not isinstance(error_data, dict):
+                    logging.error(f"API HTTP Error: {response.status_code} - {response.reason}")
+                    return {'error': f'HTTP {response.status_code}: {response.reason}',
+                            'statusCode': response.status_code}
+
+                error_data['statusCode'] = response.status_code
+                logging.error(f"API HTTP Error: {response.status_code} - {error_data}")
+                return error_data
 
-            response_data = json.loads(str(response.read(), "utf-8"))
-            logging.debug(f"API Response: {method} {path} -> {response.code}")
+            response_data = json_loads(response.content)
+            logging.debug(f"API Response: {method} {path} -> {response.status_code}")
             return response_data
 
-        except HTTPError as e:
-            try:
-                error_data = json.loads(e.read().decode('utf-8'))
-                if hasattr(e, 'code'):
-                    error_data['statusCode'] = e.code
-                logging.error(f"API HTTP Error: {e.code} - {error_data}")
-                return error_data
-            except:
-                logging.error(f"API HTTP Error: {e.code} - {e.reason}")
-                return {'error': f'HTTP {e.code}: {e.reason}', 'statusCode': e.code}
-
-        except URLError as e:
-            logging.error(f"API URL Error: {e}")
-            return {'error': f'Network error: {e.reason}'}
+        except requests.exceptions.RequestException as e:
+            logging.error(f"API Network Error: {e}")
+            return {'error': f'Network error: {e}'}
         except Exception as e:
             logging.error(f"API Unexpected Error: {e}")
             return {'error': f'Unexpected error: {str(e)}'}
 
     def ___build_headers(self, method, api_key, private_key, path, data):
         """Build authentication headers"""
-        now = str(int(time.time() * 1000))
-        message = method + path + now
+        now = str(time.time_ns() // 1_000_000)  # Integer ms, no float rounding
+        # Method, path and timestamp are ASCII; build the signed message as bytes directly
+        message = method.encode() + path.encode() + now.encode()
         if data is not None:
             message += data
 
@@ -185,12 +285,38 @@ class BTCMarketsClient:
         }
         return headers
 
-    def __sign_message(self, private_key, message):
-        """Sign message using HMAC-SHA512"""
-        signature = base64.b64encode(hmac.new(
-            private_key, message.encode('utf-8'), digestmod=hashlib.sha512).digest())
-        signature = signature.decode('utf8')
-        return signature
+    def __sign_message(self, private_key, message: bytes):
+        """Sign message bytes using HMAC-SHA512 (one-shot C fast path)"""
+        return base64.b64encode(hmac.digest(private_key, message, 'sha512')).decode('utf8')
+
+
+class BTCMarketsAdminClient(BTCMarketsReadClient):
+    """BTCMarkets client with the order management calls the bot itself doesn't use"""
+
+    def get_orders(self, status='all'):
+        """Get orders with optional status filter"""
+        query_string = f'status={status}' if status else ''
+        return self._make_http_call('GET', self.api_key, self.private_key, '/v3/orders', query_string)
+
+    def place_limit_buy_order(self, market_id, amount, price):
+        """Place a limit buy order"""
+        payload = {
+            'marketId': market_id,
+            'price': str(price),
+            'amount': str(amount),
+            'type': 'Limit',
+            'side': 'Bid'
+        }
+        return self._make_http_call('POST', self.api_key, self.private_key, '/v3/orders', None, payload)
+
+    def cancel_order(self, order_id):
+        """Cancel an order by ID"""
+        query_string = f'id={order_id}'
+        return self._make_http_call('DELETE', self.api_key, self.private_key, '/v3/orders', query_string)
+
+
+# Backwards-compatible name for the full client
+BTCMarketsClient = BTCMarketsAdminClient
 
 
 class BTCAccumulationBot:
@@ -202,14 +328,24 @@ class BTCAccumulationBot:
         # Validate configuration on startup
         Config.validate()
         self.config = Config()
-        self.client = BTCMarketsClient(self.config.BTCMARKETS_API_KEY, self.config.BTCMARKETS_PRIVATE_KEY)
+        self.client = BTCMarketsReadClient(self.config.BTCMARKETS_API_KEY, self.config.BTCMARKETS_PRIVATE_KEY)
 
         # Market configuration
         self.market_id = 'BTC-AUD'
         self.min_btc_order = 0.001  # Minimum BTC order size
 
+        # Short-lived caches so one run doesn't refetch the same ticker/balances
+        self.cache_ttl = 30  # seconds
+        self._price_cache = None
+        self._price_cache_ts = 0
+        self._balance_cache = None
+        self._balance_cache_ts = 0
+
     def get_current_price(self) -> float:
-        """Get current BTC price"""
+        """Get current BTC price (cached for cache_ttl seconds)"""
+        if self._price_cache is not None and time.monotonic() - self._price_cache_ts < self.cache_ttl:
+            return self._price_cache
+
         try:
             ticker = self.client.get_ticker(self.market_id)
 
@@ -219,35 +355,40 @@ class BTCAccumulationBot:
 
             price = float(ticker['lastPrice'])
             logging.debug(f"Current BTC price: ${price:,.2f} AUD")
+
+            self._price_cache = price
+            self._price_cache_ts = time.monotonic()
             return price
 
         except Exception as e:
             logging.error(f"Failed to get current price: {e}")
             raise
 
-    def get_mayer_multiple(self) -> float:
-        """Calculate Mayer Multiple using 200-day MA"""
+    def get_mayer_multiple(self, closes=None, current_price: Optional[float] = None) -> float:
+        """Calculate Mayer Multiple using 200-day MA (closes/current_price are fetched if not given)"""
         try:
-            # Get 200 days of daily candles
-            candles = self.client.get_candles(self.market_id, '1d', 200)
+            # Get 200 days of daily closing prices. BTCMarkets returns newest first,
+            # so these are the MA window (and the mean doesn't care about order).
+            if closes is None:
+                closes = self.client.get_candle_closes(self.market_id, '1d', 200)
 
             # Check for API error
-            if 'error' in candles or 'statusCode' in candles:
-                raise Exception(f"Candles API Error: {candles.get('error', candles)}")
+            if isinstance(closes, dict):
+                raise Exception(f"Candles API Error: {closes.get('error', closes)}")
 
-            if not candles or len(candles) == 0:
+            if len(closes) == 0:
                 raise Exception("No candle data received")
 
-            # Extract closing prices (BTCMarkets returns newest first, so reverse)
-            prices = [float(candle[4]) for candle in reversed(candles)]
-
-            if len(prices) < 50:  # Need at least 50 days for meaningful MA
-                raise Exception(f"Insufficient price data: only {len(prices)} days available")
+            if len(closes) < 50:  # Need at least 50 days for meaningful MA
+                raise Exception(f"Insufficient price data: only {len(closes)} days available")
 
             # Calculate 200-day moving average (or available data)
-            ma_period = min(200, len(prices))
-            ma_200 = np.mean(prices[-ma_period:])
-            current_price = self.get_current_price()
+            ma_period = len(closes)
+            # closes is already a float64 array, so one C-level mean; convert back to a
+            # plain float so the Mayer/strategy math below stays off NumPy scalar dispatch
+            ma_200 = float(closes.mean())
+            if current_price is None:
+                current_price = self.get_current_price()
 
             mayer_multiple = current_price / ma_200
 
@@ -265,10 +406,10 @@ class BTCAccumulationBot:
         """Get Fear & Greed Index with robust error handling"""
         try:
             url = "https://api.alternative.me/fng/"
-            response = requests.get(url, timeout=10)
+            response = self.client.session.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             fear_greed_value = int(data['data'][0]['value'])
 
             logging.info(f"😱 Fear & Greed Index: {fear_greed_value}")
@@ -287,45 +428,27 @@ class BTCAccumulationBot:
             logging.warning(f"Fear & Greed Index unexpected error: {e} - using neutral value")
             return 50
 
-    def calculate_buy_amount(self) -> Tuple[float, str]:
-        """Calculate buy amount using Mayer Multiple + Fear & Greed strategy"""
+    def calculate_buy_amount(self, closes=None, current_price: Optional[float] = None,
+                             fear_greed: Optional[int] = None) -> Tuple[float, str]:
+        """Calculate buy amount using Mayer Multiple + Fear & Greed strategy
+
+        Prefetched closes, current_price and fear_greed may be passed in; anything
+        missing is fetched here.
+        """
         try:
             logging.info(f"calculate_buy_amount::maximum buy amount: ${self.config.MAX_WEEKLY_AMOUNT:.2f} AUD")
             logging.info(f"calculate_buy_amount::minimum buy amount: ${self.config.MIN_WEEKLY_AMOUNT:.2f} AUD")
 
-            mayer = self.get_mayer_multiple()
-            fear_greed = self.get_fear_greed_index()
+            mayer = self.get_mayer_multiple(closes, current_price)
+            if fear_greed is None:
+                fear_greed = self.get_fear_greed_index()
 
             base_amount = self.config.BASE_WEEKLY_AMOUNT
-            multiplier = 1.0
-
-            # Enhanced Mayer Multiple + Fear & Greed strategy
-            if mayer < 0.8 and fear_greed < 25:
-                multiplier = 4.0  # Perfect storm
-                signal = f"🚀 PERFECT STORM: Mayer {mayer:.3f} + F&G {fear_greed}"
-            elif mayer < 0.8 and fear_greed < 35:
-                multiplier = 3.5  # Extreme oversold with fear
-                signal = f"🔥 EXTREME OVERSOLD + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
-            elif mayer < 0.8:
-                multiplier = 3.0  # Extreme oversold
-                signal = f"🔥 EXTREME OVERSOLD: Mayer {mayer:.3f}"
-            elif mayer < 1.0 and fear_greed < 30:
-                multiplier = 2.5  # Undersold + fear
-                signal = f"💎 UNDERSOLD + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
-            elif mayer < 1.0:
-                multiplier = 1.8  # Standard undersold
-                signal = f"📈 UNDERSOLD: Mayer {mayer:.3f}"
-            elif mayer < 1.2 and fear_greed < 40:
-                multiplier = 1.2  # Fair value with some fear
-                signal = f"⚖️ FAIR VALUE + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
-            elif mayer > 2.4:
-                multiplier = 0.0  # Extreme bubble
-                signal = f"🛑 EXTREME BUBBLE: Mayer {mayer:.3f} - STOP buying"
-            elif mayer > 1.6:
-                multiplier = 0.2  # Minimal buying when overbought
-                signal = f"⚠️ OVERBOUGHT: Mayer {mayer:.3f}"
-            else:
-                signal = f"⚖️ FAIR VALUE: Mayer {mayer:.3f}"
+
+            # Enhanced Mayer Multiple + Fear & Greed strategy (see STRATEGY_TABLE)
+            bucket = _strategy_bucket(mayer, fear_greed)
+            multiplier = _bucket_multiplier(bucket)
+            signal = _bucket_signal(bucket, mayer, fear_greed)
 
             final_amount = base_amount * multiplier
             final_amount = max(min(final_amount, self.config.MAX_WEEKLY_AMOUNT),
@@ -341,7 +464,10 @@ class BTCAccumulationBot:
             raise
 
     def get_account_balance(self) -> Dict[str, float]:
-        """Get account balances - FIXED for correct API response format"""
+        """Get account balances - FIXED for correct API response format (cached for cache_ttl seconds)"""
+        if self._balance_cache is not None and time.monotonic() - self._balance_cache_ts < self.cache_ttl:
+            return self._balance_cache
+
         try:
             balances = self.client.get_account_balances()
 
@@ -393,6 +519,9 @@ class BTCAccumulationBot:
 
             logging.info(f"✅ Successfully parsed {len(balance_info)} account balances")
             logging.debug(f"Balances: {balance_info}")
+
+            self._balance_cache = balance_info
+            self._balance_cache_ts = time.monotonic()
             return balance_info
 
         except Exception as e:
@@ -445,6 +574,9 @@ class BTCAccumulationBot:
                 logging.error(f"❌ Order failed: {error_msg}")
                 return {'success': False, 'reason': error_msg}
 
+            # Balances changed - force a refetch for the portfolio summary
+            self._balance_cache = None
+
             # Log successful order
             order_id = order_result.get('orderId', 'N/A')
             order_status = order_result.get('status', 'Unknown')
@@ -470,11 +602,14 @@ class BTCAccumulationBot:
             logging.error(f"❌ Order execution error: {str(e)}")
             return {'success': False, 'reason': str(e)}
 
-    def get_portfolio_summary(self) -> Optional[Dict]:
-        """Get portfolio summary with error handling"""
+    def get_portfolio_summary(self, balances: Optional[Dict[str, float]] = None,
+                              current_price: Optional[float] = None) -> Optional[Dict]:
+        """Get portfolio summary with error handling (balances/current_price are fetched if not given)"""
         try:
-            balances = self.get_account_balance()
-            current_price = self.get_current_price()
+            if balances is None:
+                balances = self.get_account_balance()
+            if current_price is None:
+                current_price = self.get_current_price()
 
             btc_balance = balances.get('BTC', 0)
             aud_balance = balances.get('AUD', 0)
@@ -534,15 +669,26 @@ class BTCAccumulationBot:
             if not self.test_api_connection():
                 raise Exception("API connection test failed")
 
+            # Fetch the independent market/account data concurrently so the run waits
+            # for the slowest request rather than the sum of all of them
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                price_future = executor.submit(self.get_current_price)
+                closes_future = executor.submit(self.client.get_candle_closes, self.market_id, '1d', 200)
+                fear_greed_future = executor.submit(self.get_fear_greed_index)
+                balances_future = executor.submit(self.get_account_balance)
+
+            current_price = price_future.result()
+            balances = balances_future.result()
+
             # Get current metrics
             logging.info("📊 Calculating market signals...")
-            buy_amount, signal = self.calculate_buy_amount()
+            buy_amount, signal = self.calculate_buy_amount(closes_future.result(), current_price,
+                                                           fear_greed_future.result())
 
-            current_price = self.get_current_price()
             logging.info(f"💰 Current BTC Price: ${current_price:,.2f} AUD")
 
             # Get portfolio summary
-            portfolio = self.get_portfolio_summary()
+            portfolio = self.get_portfolio_summary(balances, current_price)
             if portfolio:
                 logging.info("-" * 50)
                 logging.info("📋 CURRENT PORTFOLIO")
@@ -2,12 +2,20 @@
 """
 Enhanced deployment script for BTC bot with advanced log exploration
 """
+import atexit
+import inspect
+import shlex
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import os
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Load variables from .env into os.environ
 load_dotenv()
@@ -17,66 +25,234 @@ EC2_IP = os.getenv('AWS_EC2_PUBLIC_IP')  # Replace with your IP
 KEY_PATH = os.getenv('KEY_PATH')
 REMOTE_PATH = "/home/ec2-user/btc-bot"
 
-def run_command(cmd, description, capture_output=True):
-    """Run shell command with nice output"""
+# Reuse one SSH connection for every ssh/rsync call: the first call opens a
+# master session and later calls multiplex over its UNIX socket. %C is a hash of
+# user/host/port, so long EC2 DNS names can't overflow the 108-byte socket path
+SSH_OPTS = ["-o", "ControlMaster=auto", "-o", "ControlPath=~/.ssh/btc-bot-cm-%C",
+            "-o", "ControlPersist=600"]
+Path.home().joinpath(".ssh").mkdir(mode=0o700, exist_ok=True)
+
+# Shipped by deploy_bot; every log view is one of its subcommands
+LOG_QUERY = f"{REMOTE_PATH}/scripts/log_query.sh"
+
+# Whether zstd exists on both ends; probed on first use (None until then)
+_zstd_available = None
+
+
+def ssh_argv(*remote_args, extra_opts=()):
+    """Build the argv that runs remote_args on the EC2 host over the shared connection"""
+    return ["ssh", "-i", str(KEY_PATH), *SSH_OPTS, *extra_opts, f"ec2-user@{EC2_IP}", *remote_args]
+
+
+def remote_script_argv(*script_args):
+    """Build the argv that runs a bash script fed on stdin, with script_args as $1, $2, ..."""
+    return ssh_argv("bash", "-s", "--", *(shlex.quote(str(arg)) for arg in script_args))
+
+
+def log_query_argv(subcommand, *args):
+    """Build the argv that runs a log_query.sh subcommand on the EC2 host"""
+    return ssh_argv(shlex.join([LOG_QUERY, subcommand, *map(str, args)]))
+
+
+def ssh_close():
+    """Stop the shared SSH master taking new clients (no-op if none is open)
+
+    Unlike -O exit this leaves sessions other deploy.py processes have open on it,
+    such as a running live log viewer, to finish; the master exits after the last one.
+    """
+    subprocess.run(ssh_argv(extra_opts=["-O", "stop"]), capture_output=True)
+
+
+atexit.register(ssh_close)
+
+
+def write_output(data):
+    """Write captured bytes to stdout with one flush, skipping a decode/re-encode round trip"""
+    sys.stdout.flush()  # keep ordering with text already printed
+    sys.stdout.buffer.write(data)  # separate writes: data + b"\n" would copy the whole buffer
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def stream_output(pipe):
+    """Copy a subprocess stdout pipe to ours as lines arrive, in constant memory"""
+    sys.stdout.flush()  # keep ordering with text already printed
+    wrote = False
+    for line in pipe:
+        sys.stdout.buffer.write(line)
+        wrote = True
+    if wrote:
+        sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def run_command(argv, description, input=None, capture_output=True):
+    """Run command (argv list, no local shell) with nice output; input is fed on stdin"""
     print(f"🔄 {description}...")
+    if isinstance(input, str):
+        input = input.encode()
     try:
+        result = subprocess.run(argv, input=input, capture_output=capture_output, check=True)
+        if capture_output and result.stdout:
+            write_output(result.stdout)
+        return True
+    except subprocess.CalledProcessError as e:
         if capture_output:
-            result = subprocess.run(cmd,
-                                    shell=True,
-                                    check=True,
-                                    capture_output=True,
-                                    text=True)
-            if result.stdout:
-                print(result.stdout)
-            return True
+            print(f"❌ {description} failed: ", end="")
+            write_output(e.stderr or b"")
         else:
-            # For interactive commands like tail -f
-            result = subprocess.run(cmd, shell=True, check=True)
-            return True
+            print(f"❌ {description} failed: {e}")
+        return False
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed: {e}")
+        return False
+
+
+def capture_command(argv, description, input=None):
+    """Run command and return its stdout (None on failure) for local formatting"""
+    print(f"🔄 {description}...")
+    try:
+        result = subprocess.run(argv, input=input, text=True, capture_output=True, check=True)
+        return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr if capture_output else str(e)}")
+        print(f"❌ {description} failed: {e.stderr}")
+        return None
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed: {e}")
+        return None
+
+
+def run_command_streaming(argv, description):
+    """Run command and stream its stdout instead of capturing it, for bulk log output"""
+    print(f"🔄 {description}...")
+    try:
+        with subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, bufsize=1 << 20) as proc:
+            stream_output(proc.stdout)
+            stderr = proc.stderr.read()
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed: {e}")
         return False
 
+    if proc.returncode != 0:
+        print(f"❌ {description} failed: ", end="")
+        write_output(stderr)
+        return False
+    return True
+
+
+def tool_available(tool):
+    """Whether tool is installed both locally and on the EC2 host"""
+    return (shutil.which(tool) is not None and
+            subprocess.run(ssh_argv(f"command -v {tool}"), capture_output=True).returncode == 0)
+
+
+def zstd_available():
+    """Check once per run that zstd is installed locally and on the EC2 host"""
+    global _zstd_available
+    if _zstd_available is None:
+        _zstd_available = tool_available("zstd")
+    return _zstd_available
+
+
+def run_compressed(description, subcommand, *args):
+    """Run a bulk-output log query with its stdout zstd-compressed on the wire"""
+    argv = log_query_argv(subcommand, *args)
+    if not zstd_available():
+        return run_command_streaming(argv, description)
+
+    print(f"🔄 {description}...")
+    # Level 1 keeps the EC2 side cheap; ssh -C (gzip) would cost more CPU than it saves.
+    # pipefail so ssh exits with log_query.sh's status rather than zstd's
+    argv[-1] = shlex.join(["bash", "-o", "pipefail", "-c", f"{argv[-1]} | zstd -1 -c"])
+    ssh = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    zstd = subprocess.Popen(["zstd", "-dc"], stdin=ssh.stdout, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, bufsize=1 << 20)
+    ssh.stdout.close()
+    stream_output(zstd.stdout)
+    zstd_err = zstd.stderr.read()
+    ssh_err = ssh.stderr.read()
+    zstd.wait()
+    ssh.wait()
+
+    if ssh.returncode != 0 or zstd.returncode != 0:
+        print(f"❌ {description} failed: ", end="")
+        write_output(ssh_err or zstd_err)
+        return False
+    return True
+
 
 def deploy_bot():
     """Deploy bot to EC2 and install dependencies"""
     print("🚀 Deploying BTC Bot to EC2...")
 
     # Create remote directories
-    setup_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        mkdir -p {REMOTE_PATH}/scripts {REMOTE_PATH}/logs
-        chmod 700 {REMOTE_PATH}/scripts
-    "'''
-    if not run_command(setup_cmd, "Setting up remote directories"):
-        return False
-
-    # Install dependencies
-    install_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        python3 -m pip install --user requests numpy python-dotenv
-    "'''
-    if not run_command(install_cmd, "Installing dependencies"):
+    setup_cmd = f"mkdir -p {REMOTE_PATH}/scripts {REMOTE_PATH}/logs && chmod 700 {REMOTE_PATH}/scripts"
+    if not run_command(ssh_argv(setup_cmd), "Setting up remote directories"):
         return False
 
-    # Upload files with proper permissions
-    files_to_upload = [
+    # Upload everything in a single rsync - only changed blocks go over the wire
+    files_to_upload = ["btc_bot.py", ".env", "config/", "scripts/"]
+    file_permissions = [
         ("btc_bot.py", "644"),
         (".env", "600"),
-        ("scripts/run_bot_secure.sh", "700")
+        ("scripts", "700"),
+        ("scripts/run_bot_secure.sh", "700"),
+        ("scripts/log_query.sh", "700")
     ]
 
-    for file, perms in files_to_upload:
+    sources = []
+    for file in files_to_upload:
         if not Path(file).exists():
-            print(f"❌ {file} not found!")
+            print(f"⚠️ {file} not found, skipping")
             continue
-
-        upload_cmd = f'scp -i "{KEY_PATH}" {file} ec2-user@{EC2_IP}:{REMOTE_PATH}/{file}'
-        if not run_command(upload_cmd, f"Uploading {file}"):
+        sources.append(file)
+
+    if tool_available("rsync"):
+        # --checksum because .env is regenerated on every CI run, so its mtime churns
+        # without content changes; for a handful of small files the hashing is free
+        rsync_ssh = shlex.join(["ssh", "-i", str(KEY_PATH), *SSH_OPTS])
+        upload_argv = ["rsync", "-az", "--checksum", "--delete", "--relative", "-e", rsync_ssh,
+                       *sources, f"ec2-user@{EC2_IP}:{REMOTE_PATH}/"]
+        upload_batch = None
+    else:
+        # No rsync on one end: push everything through a single sftp session instead
+        upload_argv = ["sftp", "-i", str(KEY_PATH), *SSH_OPTS, "-b", "-", f"ec2-user@{EC2_IP}:{REMOTE_PATH}/"]
+        batch = []
+        for source in sources:
+            if source.endswith("/"):
+                # "-" lets the batch carry on when the directory already exists
+                batch += [f"-mkdir {source.rstrip('/')}", f"put -r {source.rstrip('/')}"]
+            else:
+                batch.append(f"put {source}")
+        upload_batch = "\n".join(batch) + "\n"
+
+    # Installing dependencies and uploading are independent, so run them side by
+    # side - each gets its own channel on the shared ControlMaster connection
+    # orjson is optional (btc_bot falls back to stdlib json); it goes in its own pip call
+    # so a missing wheel can't abort the required install
+    install_cmd = ("python3 -m pip install --user requests numpy python-dotenv && "
+                   "{ python3 -m pip install --user orjson || echo '⚠️ orjson unavailable, using stdlib json'; }")
+    steps = [
+        (ssh_argv(install_cmd), "Installing dependencies", None),
+        (upload_argv, f"Uploading {', '.join(sources)}", upload_batch)
+    ]
+    # ripgrep speeds up the log views but is optional - they fall back to grep
+    ripgrep_cmd = ("command -v rg >/dev/null || "
+                   "{ sudo amazon-linux-extras install -y epel && sudo yum install -y ripgrep; }")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ripgrep = executor.submit(run_command, ssh_argv(ripgrep_cmd), "Ensuring ripgrep is installed")
+        futures = [executor.submit(run_command, argv, description, stdin) for argv, description, stdin in steps]
+        if not all(future.result() for future in as_completed(futures)):
             return False
+        if not ripgrep.result():
+            print("⚠️ ripgrep unavailable, log views will use grep")
 
-        chmod_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "chmod {perms} {REMOTE_PATH}/{file}"'''
-        if not run_command(chmod_cmd, f"Setting permissions for {file}"):
-            return False
+    # rsync -a and sftp put carry local modes across, so set the intended ones in one go
+    chmods = "; ".join(f"chmod {perms} {REMOTE_PATH}/{file}"
+                       for file, perms in file_permissions if Path(file).exists())
+    if not run_command(ssh_argv(chmods), "Setting file permissions"):
+        return False
 
     print("🎉 Deployment successful!")
     return True
@@ -86,7 +262,7 @@ def test_bot():
     """Test bot execution on remote server with environment loading"""
     print("🧪 Testing bot execution...")
 
-    test_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
+    test_script = f'''
         cd {REMOTE_PATH}
 
         # Check dependencies
@@ -107,14 +283,14 @@ def test_bot():
 
         # Check permissions
         echo '🔒 Checking file permissions...'
-        [ $(stat -c %a .env) = "600" ] || echo "⚠️ Warning: .env permissions should be 600"
-        [ $(stat -c %a scripts/run_bot_secure.sh) = "700" ] || echo "⚠️ Warning: run_bot_secure.sh should be 700"
+        [ "$(stat -c %a .env)" = "600" ] || echo "⚠️ Warning: .env permissions should be 600"
+        [ "$(stat -c %a scripts/run_bot_secure.sh)" = "700" ] || echo "⚠️ Warning: run_bot_secure.sh should be 700"
 
         echo '🔄 Running bot test...'
         ./scripts/run_bot_secure.sh test
-    "'''
+    '''
 
-    if run_command(test_cmd, "Running bot test"):
+    if run_command(remote_script_argv(), "Running bot test", input=test_script):
         print("✅ Bot test successful! Check the logs for details.")
     else:
         print("❌ Bot test failed - check the logs")
@@ -124,13 +300,13 @@ def dry_run():
     """Execute bot in dry-run mode"""
     print("🔬 Executing bot in dry-run mode...")
 
-    dry_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
+    dry_script = f'''
         cd {REMOTE_PATH}
         export DRY_RUN=1
         ./scripts/run_bot_secure.sh
-    "'''
+    '''
 
-    if run_command(dry_cmd, "Running dry-run"):
+    if run_command(remote_script_argv(), "Running dry-run", input=dry_script):
         print("✅ Dry-run completed successfully! Check the logs for details.")
     else:
         print("❌ Dry-run failed - check the logs")
@@ -140,7 +316,7 @@ def check_environment():
     """Check if environment is properly configured on remote server"""
     print("🔍 Checking remote environment configuration...")
 
-    check_cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
+    check_script = f'''
         cd {REMOTE_PATH}
         echo '=== ENVIRONMENT CHECK ==='
 
@@ -148,7 +324,7 @@ def check_environment():
         if [ -f .env ]; then
             echo '✅ .env file found'
             echo '📊 Environment variables in .env:'
-            grep -v '^#' .env | grep -v '^\\$' | cut -d'=' -f1 | sed 's/^/  - /'
+            grep -v '^#' .env | grep -v '^$' | cut -d'=' -f1 | sed 's/^/  - /'
         else
             echo '❌ .env file not found'
         fi
@@ -157,16 +333,16 @@ def check_environment():
         echo '=== BOT FILE CHECK ==='
         if [ -f btc_bot.py ]; then
             echo '✅ Bot file found'
-            echo 'Last modified:' \\$(stat -c %y btc_bot.py)
+            echo 'Last modified:' $(stat -c %y btc_bot.py)
         else
             echo '❌ Bot file not found'
         fi
-    "'''
+    '''
 
-    run_command(check_cmd, "Checking environment configuration")
+    run_command(remote_script_argv(), "Checking environment configuration", input=check_script)
 
 
-def view_logs(subcommand=None):
+def view_logs(subcommand=None, *args):
     """Enhanced log viewing with multiple options"""
 
     if not subcommand:
@@ -196,290 +372,192 @@ Examples:
         """)
         return
 
-    if subcommand == "today":
-        view_today_log()
-    elif subcommand == "live":
-        view_live_log()
-    elif subcommand == "yesterday":
-        view_yesterday_log()
-    elif subcommand == "week":
-        view_week_logs()
-    elif subcommand == "all":
-        list_all_logs()
-    elif subcommand == "search":
-        search_logs()
-    elif subcommand == "errors":
-        view_errors()
-    elif subcommand == "purchases":
-        view_purchases()
-    elif subcommand == "portfolio":
-        view_portfolio_summaries()
-    elif subcommand == "stats":
-        view_stats()
-    elif subcommand == "tail":
-        view_tail_log()
-    else:
+    handler = DISPATCH.get(subcommand)
+    if handler is None:
         print(f"❌ Unknown log option: {subcommand}")
-        view_logs()  # Show help
+        print("Run 'python deploy.py logs' to see the available options")
+        return
+
+    try:
+        inspect.signature(handler).bind(*args)
+    except TypeError:
+        print(f"❌ Too many arguments for 'logs {subcommand}'")
+        return
+    handler(*args)
 
 
 def view_today_log():
     """View today's log"""
     print("📄 Fetching today's log...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        LOG_FILE={REMOTE_PATH}/logs/btc_bot_\\$(date +%Y%m%d).log
-        if [ -f \\$LOG_FILE ]; then
-            tail -50 \\$LOG_FILE
-        else
-            echo '❌ No log file found for today'
-            echo 'Available logs:'
-            ls -la {REMOTE_PATH}/logs/ | tail -5
-        fi
-    "'''
-
-    run_command(cmd, "Fetching today's log")
+    run_command(log_query_argv("today"), "Fetching today's log")
 
 
 def view_live_log():
-    """View live log with follow mode"""
+    """View live log with follow mode, flushing buffered output every 100 ms"""
     print("👀 Starting live log viewer... (Press Ctrl+C to exit)")
     print("=" * 50)
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        LOG_FILE={REMOTE_PATH}/logs/btc_bot_\\$(date +%Y%m%d).log
-        if [ -f \\$LOG_FILE ]; then
-            echo 'Following live log: '\\$LOG_FILE
-            echo '=================================='
-            tail -f \\$LOG_FILE
-        else
-            echo '❌ No log file found for today'
-            echo 'Creating empty log file and watching...'
-            touch \\$LOG_FILE
-            tail -f \\$LOG_FILE
-        fi
-    "'''
-
-    run_command(cmd, "Starting live log viewer", capture_output=False)
+    argv = ssh_argv(shlex.join([LOG_QUERY, "live"]), extra_opts=["-o", "ServerAliveInterval=30"])
+
+    # A reader thread drains ssh into the deque; the main thread writes whatever
+    # has accumulated in one write() per tick instead of one per line
+    lines = deque(maxlen=1000)
+
+    def flush():
+        batch = []
+        while lines:
+            batch.append(lines.popleft())
+        if batch:
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+
+    with subprocess.Popen(argv, stdout=subprocess.PIPE, bufsize=1 << 16,
+                          text=True, encoding="utf-8", errors="replace") as proc:
+        reader = threading.Thread(target=lambda: lines.extend(proc.stdout), daemon=True)
+        reader.start()
+        try:
+            while proc.poll() is None:
+                time.sleep(0.1)
+                flush()
+        except KeyboardInterrupt:
+            proc.terminate()
+            print("\n🛑 Live log viewer stopped")
+        reader.join(timeout=1)
+        flush()
 
 
 def view_yesterday_log():
-    """View yesterday's log"""
+    """View yesterday's log (by the EC2 host's clock, like every other view)"""
     print("📄 Fetching yesterday's log...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        YESTERDAY=\\$(date -d 'yesterday' +%Y%m%d)
-        LOG_FILE={REMOTE_PATH}/logs/btc_bot_\\$YESTERDAY.log
-        if [ -f \\$LOG_FILE ]; then
-            echo '=== YESTERDAY\\'S LOG ('\\$YESTERDAY') ==='
-            cat \\$LOG_FILE
-        else
-            echo '❌ No log file found for yesterday'
-        fi
-    "'''
-
-    run_command(cmd, "Fetching yesterday's log")
+    run_compressed("Fetching yesterday's log", "yesterday")
 
 
 def view_week_logs():
-    """View last 7 days of logs"""
+    """View last 7 days of logs (by the EC2 host's clock, like every other view)"""
     print("📅 Fetching last 7 days of logs...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        echo '=== LAST 7 DAYS OF BOT ACTIVITY ==='
-        cd {REMOTE_PATH}/logs
-        for i in {{6..0}}; do
-            DATE=\\$(date -d \\"\\$i days ago\\" +%Y%m%d)
-            LOG_FILE=btc_bot_\\$DATE.log
-            if [ -f \\$LOG_FILE ]; then
-                echo ''
-                echo '--- '\\$(date -d \\"\\$i days ago\\" +%Y-%m-%d)' ---'
-                grep -E '(Starting BTC|PERFECT STORM|EXTREME|UNDERSOLD|OVERBOUGHT|PURCHASE SUCCESSFUL|PURCHASE FAILED|CRITICAL ERROR)' \\$LOG_FILE 2>/dev/null || echo 'No activity'
-            fi
-        done
-    "'''
+    run_compressed("Fetching weekly activity summary", "week")
+
 
-    run_command(cmd, "Fetching weekly activity summary")
+def human_size(size):
+    """Format a byte count the way ls -h does (e.g. 512, 4.0K, 12M)"""
+    if size < 1024:
+        return str(size)
+    for unit in "KMGT":
+        size /= 1024
+        if size < 1024 or unit == "T":
+            return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
 
 
 def list_all_logs():
     """List all available log files"""
     print("📋 Listing all available log files...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== ALL LOG FILES ==='
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            ls -lah btc_bot_*.log | while read line; do
-                filename=\\$(echo \\$line | awk '{{print \\$9}}')
-                size=\\$(echo \\$line | awk '{{print \\$5}}')
-                date=\\$(echo \\$line | awk '{{print \\$6, \\$7, \\$8}}')
-                echo \\\"📄 \\$filename (\\$size) - \\$date\\\"
-            done
-        else
-            echo '❌ No log files found'
-        fi
+    output = capture_command(log_query_argv("list"), "Listing all log files")
+    if output is None:
+        return
 
-        echo ''
-        echo '=== DISK USAGE ==='
-        du -sh . 2>/dev/null || echo 'Could not calculate disk usage'
-    "'''
+    logs = []
+    disk_usage = ""
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if fields[0] == "DU":
+            disk_usage = "\t".join(fields[1:])
+        elif len(fields) == 3:
+            logs.append(fields)
+
+    print("=== ALL LOG FILES ===")
+    if logs:
+        for filename, size, mtime in logs:
+            date = datetime.fromtimestamp(int(mtime)).strftime("%b %d %H:%M")
+            print(f"📄 {filename} ({human_size(int(size))}) - {date}")
+    else:
+        print("❌ No log files found")
 
-    run_command(cmd, "Listing all log files")
+    print("")
+    print("=== DISK USAGE ===")
+    print(disk_usage or "Could not calculate disk usage")
 
 
-def search_logs():
-    """Search logs for specific terms"""
-    if len(sys.argv) < 4:
+def search_logs(search_term=None):
+    """Search logs for specific terms (prompts when no term is given)"""
+    if search_term is None:
         search_term = input("🔍 Enter search term: ")
-    else:
-        search_term = sys.argv[3]
 
     print(f"🔍 Searching logs for: '{search_term}'")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== SEARCH RESULTS FOR: {search_term} ==='
-
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            grep -n -i '{search_term}' btc_bot_*.log 2>/dev/null | head -20 | while IFS=':' read file line content; do
-                echo \\\"📄 \\$file [Line \\$line]: \\$content\\\"
-            done
-
-            echo ''
-            echo '=== SUMMARY ==='
-            total_matches=\\$(grep -i '{search_term}' btc_bot_*.log 2>/dev/null | wc -l)
-            echo \\\"Found \\$total_matches matches across log files\\\"
-        else
-            echo '❌ No log files found'
-        fi
-    "'''
-
-    run_command(cmd, f"Searching for '{search_term}'")
+    # The term is quoted as its own argument, so it can't inject shell code
+    run_command_streaming(log_query_argv("search", search_term), f"Searching for '{search_term}'")
 
 
 def view_errors():
     """Show only error messages from logs"""
     print("🚨 Fetching error messages from logs...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== ERROR MESSAGES ==='
-
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            grep -n -E '(ERROR|FAILED|❌|🚨)' btc_bot_*.log 2>/dev/null | tail -20 | while IFS=':' read file line content; do
-                echo \\\"🚨 \\$file [Line \\$line]: \\$content\\\"
-            done
-        else
-            echo '❌ No log files found'
-        fi
-    "'''
-
-    run_command(cmd, "Fetching error messages")
+    run_command(log_query_argv("errors"), "Fetching error messages")
 
 
 def view_purchases():
     """Show only successful purchases"""
     print("💰 Fetching successful purchases from logs...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== SUCCESSFUL PURCHASES ==='
-
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            grep -A 5 -B 1 'PURCHASE SUCCESSFUL' btc_bot_*.log 2>/dev/null | grep -E '(PURCHASE SUCCESSFUL|Purchased:|Amount:|Price:|Order ID:)' | while read line; do
-                echo \\\"💰 \\$line\\\"
-            done
-
-            echo ''
-            echo '=== PURCHASE SUMMARY ==='
-            total_purchases=\\$(grep 'PURCHASE SUCCESSFUL' btc_bot_*.log 2>/dev/null | wc -l)
-            echo \\\"Total successful purchases: \\$total_purchases\\\"
-        else
-            echo '❌ No log files found'
-        fi
-    "'''
-
-    run_command(cmd, "Fetching purchase history")
+    run_command(log_query_argv("purchases"), "Fetching purchase history")
 
 
 def view_portfolio_summaries():
     """Show portfolio summaries from logs"""
     print("📊 Fetching portfolio summaries from logs...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== PORTFOLIO PROGRESSION ==='
-
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            # Get the most recent portfolio summary from each day
-            for logfile in \\$(ls btc_bot_*.log 2>/dev/null | sort); do
-                date_from_file=\\$(echo \\$logfile | sed 's/btc_bot_\\(.*\\)\\.log/\\1/')
-                formatted_date=\\$(echo \\$date_from_file | sed 's/\\(....\\)\\(..\\)\\(..\\)/\\1-\\2-\\3/')
-
-                portfolio=\\$(grep -A 4 'FINAL PORTFOLIO SUMMARY' \\$logfile 2>/dev/null | tail -4)
-                if [ -n \\"\\$portfolio\\" ]; then
-                    echo \\\"\\\"
-                    echo \\"📅 \\$formatted_date:\\"
-                    echo \\"\\$portfolio\\" | sed 's/^/    /'
-                fi
-            done
-        else
-            echo '❌ No log files found'
-        fi
-    "'''
-
-    run_command(cmd, "Fetching portfolio progression")
+    run_command(log_query_argv("portfolio"), "Fetching portfolio progression")
 
 
 def view_stats():
     """Show execution statistics"""
     print("📈 Calculating bot execution statistics...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        cd {REMOTE_PATH}/logs
-        echo '=== BOT EXECUTION STATISTICS ==='
-
-        if [ \\$(ls -1 btc_bot_*.log 2>/dev/null | wc -l) -gt 0 ]; then
-            total_executions=\\$(grep 'Starting BTC Accumulation Bot' btc_bot_*.log 2>/dev/null | wc -l)
-            successful_purchases=\\$(grep 'PURCHASE SUCCESSFUL' btc_bot_*.log 2>/dev/null | wc -l)
-            failed_purchases=\\$(grep 'PURCHASE FAILED' btc_bot_*.log 2>/dev/null | wc -l)
-            no_action_days=\\$(grep 'NO PURCHASE TODAY' btc_bot_*.log 2>/dev/null | wc -l)
-
-            echo \\"📊 Total Executions: \\$total_executions\\"
-            echo \\"✅ Successful Purchases: \\$successful_purchases\\"
-            echo \\"❌ Failed Purchases: \\$failed_purchases\\"
-            echo \\"⏸️  No Action Days: \\$no_action_days\\"
-
-            if [ \\$total_executions -gt 0 ]; then
-                success_rate=\\$(echo \\"scale=1; \\$successful_purchases * 100 / \\$total_executions\\" | bc -l 2>/dev/null || echo 'N/A')
-                echo \\"📈 Purchase Rate: \\$success_rate%\\"
-            fi
-
-            echo \\\"\\\"
-            echo \\"=== STRATEGY SIGNALS (Last 30 days) ===\\"
-            grep -o -E '(PERFECT STORM|EXTREME OVERSOLD|UNDERSOLD|OVERBOUGHT|EXTREME BUBBLE)' btc_bot_*.log 2>/dev/null | sort | uniq -c | sort -nr | while read count signal; do
-                echo \\"📊 \\$signal: \\$count times\\"
-            done
-
-            echo \\\"\\\"
-            echo \\"=== RECENT ACTIVITY ===\\"
-            tail -1 btc_bot_*.log 2>/dev/null | grep 'Bot execution completed' | wc -l | xargs echo \\"Last successful completion: \\" executions
-
-        else
-            echo '❌ No log files found'
-        fi
-    "'''
-
-    run_command(cmd, "Calculating statistics")
+    output = capture_command(log_query_argv("stats"), "Calculating statistics")
+    if output is None:
+        return
 
+    print("=== BOT EXECUTION STATISTICS ===")
+    if output.strip() == "NO_LOGS":
+        print("❌ No log files found")
+        return
 
-def view_tail_log():
-    """View last N lines of today's log"""
-    if len(sys.argv) < 4:
+    counts = [0] * 5
+    signals = []
+    for line in output.splitlines():
+        kind, _, rest = line.partition(" ")
+        if kind == "COUNTS":
+            counts = [int(value) for value in rest.split()]
+        elif kind == "SIG":
+            count, _, signal = rest.partition(" ")
+            signals.append((int(count), signal))
+
+    total_executions, successful_purchases, failed_purchases, no_action_days, completed = counts
+    print(f"📊 Total Executions: {total_executions}")
+    print(f"✅ Successful Purchases: {successful_purchases}")
+    print(f"❌ Failed Purchases: {failed_purchases}")
+    print(f"⏸️  No Action Days: {no_action_days}")
+    if total_executions > 0:
+        print(f"📈 Purchase Rate: {successful_purchases * 100 / total_executions:.1f}%")
+
+    print("")
+    print("=== STRATEGY SIGNALS (Last 30 days) ===")
+    for count, signal in sorted(signals, reverse=True):
+        print(f"📊 {signal}: {count} times")
+
+    print("")
+    print("=== RECENT ACTIVITY ===")
+    print(f"Last successful completion:  {completed} executions")
+
+
+def view_tail_log(lines=None):
+    """View last N lines of today's log (prompts when N is not given)"""
+    if lines is None:
         lines = input("📄 Number of lines to show (default 100): ") or "100"
-    else:
-        lines = sys.argv[3]
 
     try:
         lines = int(lines)
@@ -489,23 +567,32 @@ def view_tail_log():
 
     print(f"📄 Fetching last {lines} lines of today's log...")
 
-    cmd = f'''ssh -i "{KEY_PATH}" ec2-user@{EC2_IP} "
-        LOG_FILE={REMOTE_PATH}/logs/btc_bot_\\$(date +%Y%m%d).log
-        if [ -f \\$LOG_FILE ]; then
-            tail -{lines} \\$LOG_FILE
-        else
-            echo '❌ No log file found for today'
-        fi
-    "'''
+    if lines > 500:
+        run_compressed(f"Fetching last {lines} lines", "tail", lines)
+    else:
+        run_command(log_query_argv("tail", lines), f"Fetching last {lines} lines")
+
 
-    run_command(cmd, f"Fetching last {lines} lines")
+# Subcommand name -> handler for `python deploy.py logs <subcommand> [args]`
+DISPATCH = {
+    "today": view_today_log,
+    "live": view_live_log,
+    "yesterday": view_yesterday_log,
+    "week": view_week_logs,
+    "all": list_all_logs,
+    "search": search_logs,
+    "errors": view_errors,
+    "purchases": view_purchases,
+    "portfolio": view_portfolio_summaries,
+    "stats": view_stats,
+    "tail": view_tail_log,
+}
 
 
 def ssh_connect():
     """Open SSH connection"""
     print("🔗 Opening SSH connection...")
-    ssh_cmd = f'ssh -i "{KEY_PATH}" ec2-user@{EC2_IP}'
-    os.system(ssh_cmd)
+    subprocess.run(ssh_argv())
 
 
 def show_help():
@@ -561,8 +648,7 @@ if __name__ == "__main__":
     elif command == "check":
         check_environment()
     elif command == "logs":
-        subcommand = sys.argv[2] if len(sys.argv) > 2 else None
-        view_logs(subcommand)
+        view_logs(*sys.argv[2:])
     elif command == "ssh":
         ssh_connect()
     elif command == "help":
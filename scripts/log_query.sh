@@ -0,0 +1,192 @@
+#!/bin/bash
+
+# Log queries run by deploy.py: log_query.sh <subcommand> [args...]
+
+LOG_DIR="$(cd "$(dirname "$0")/../logs" && pwd)" || exit 1
+cd "$LOG_DIR" || exit 1
+
+# Every date comes from this one reading of the host's clock - the bot names its
+# logs by host-local date, so the client's (possibly different) timezone never decides
+# which file is "today". printf's %(...)T is a bash builtin, so no date fork per day
+printf -v NOW '%(%s)T' -1
+day_stamp() { printf -v "$1" "%($2)T" $((NOW - $3 * 86400)); }
+day_stamp TODAY '%Y%m%d' 0
+TODAY_LOG="$LOG_DIR/btc_bot_$TODAY.log"
+
+# Every log file, oldest first (the names sort by date); empty when there are none
+shopt -s nullglob
+LOGS=(btc_bot_*.log)
+
+require_logs() {
+    if [ ${#LOGS[@]} -eq 0 ]; then
+        echo '❌ No log files found'
+        exit 0
+    fi
+}
+
+# ripgrep when installed (sorted by path so output order matches grep),
+# otherwise grep -E. Only flags both tools spell alike are used.
+# logsearch_literal matches fixed strings (-F), for user-supplied search terms;
+# grep rejects -E and -F together, so it can't just pass -F to logsearch
+if command -v rg >/dev/null 2>&1; then
+    logsearch() { rg --no-config --no-messages --sort path "$@"; }
+    logsearch_literal() { logsearch -F "$@"; }
+else
+    logsearch() { grep -E "$@"; }
+    logsearch_literal() { grep -F "$@"; }
+fi
+
+ACTIVITY='(Starting BTC|PERFECT STORM|EXTREME|UNDERSOLD|OVERBOUGHT|PURCHASE SUCCESSFUL|PURCHASE FAILED|CRITICAL ERROR)'
+
+subcommand=$1
+shift
+
+case "$subcommand" in
+    today)
+        if [ -f "$TODAY_LOG" ]; then
+            tail -50 "$TODAY_LOG"
+        else
+            echo '❌ No log file found for today'
+            echo 'Available logs:'
+            ls -la "$LOG_DIR" | tail -5
+        fi
+        ;;
+
+    live)
+        if [ -f "$TODAY_LOG" ]; then
+            echo "Following live log: $TODAY_LOG"
+            echo '=================================='
+        else
+            echo '❌ No log file found for today'
+            echo 'Creating empty log file and watching...'
+            touch "$TODAY_LOG"
+        fi
+        exec stdbuf -oL tail -F "$TODAY_LOG"
+        ;;
+
+    tail)
+        # $1: number of lines
+        if [ -f "$TODAY_LOG" ]; then
+            tail -n "$1" "$TODAY_LOG"
+        else
+            echo '❌ No log file found for today'
+        fi
+        ;;
+
+    yesterday)
+        day_stamp YESTERDAY '%Y%m%d' 1
+        if [ -f "btc_bot_$YESTERDAY.log" ]; then
+            echo "=== YESTERDAY'S LOG ($YESTERDAY) ==="
+            cat "btc_bot_$YESTERDAY.log"
+        else
+            echo '❌ No log file found for yesterday'
+        fi
+        ;;
+
+    week)
+        # Oldest day first, ending today
+        echo '=== LAST 7 DAYS OF BOT ACTIVITY ==='
+        for i in 6 5 4 3 2 1 0; do
+            day_stamp stamp '%Y%m%d' "$i"
+            logfile="btc_bot_$stamp.log"
+            if [ -f "$logfile" ]; then
+                echo ''
+                echo "--- ${stamp:0:4}-${stamp:4:2}-${stamp:6:2} ---"
+                logsearch "$ACTIVITY" "$logfile" 2>/dev/null || echo 'No activity'
+            fi
+        done
+        ;;
+
+    list)
+        # Machine-readable name/size/mtime rows, then the du line
+        stat --printf='%n\t%s\t%Y\n' "${LOGS[@]}" 2>/dev/null | sort
+        printf 'DU\t%s\n' "$(du -sh . 2>/dev/null)"
+        ;;
+
+    search)
+        # $1: search term
+        term=$1
+        echo "=== SEARCH RESULTS FOR: $term ==="
+        require_logs
+
+        logsearch_literal -H -n -i -e "$term" "${LOGS[@]}" 2>/dev/null | head -20 | while IFS=':' read file line content; do
+            echo "📄 $file [Line $line]: $content"
+        done
+
+        echo ''
+        echo '=== SUMMARY ==='
+        total_matches=$(logsearch_literal --no-filename -i -e "$term" "${LOGS[@]}" 2>/dev/null | wc -l)
+        echo "Found $total_matches matches across log files"
+        ;;
+
+    errors)
+        echo '=== ERROR MESSAGES ==='
+        require_logs
+
+        logsearch -H -n '(ERROR|FAILED|❌|🚨)' "${LOGS[@]}" 2>/dev/null | tail -20 | while IFS=':' read file line content; do
+            echo "🚨 $file [Line $line]: $content"
+        done
+        ;;
+
+    purchases)
+        echo '=== SUCCESSFUL PURCHASES ==='
+        require_logs
+
+        logsearch -H -A 5 -B 1 'PURCHASE SUCCESSFUL' "${LOGS[@]}" 2>/dev/null | grep -E '(PURCHASE SUCCESSFUL|Purchased:|Amount:|Price:|Order ID:)' | while read line; do
+            echo "💰 $line"
+        done
+
+        echo ''
+        echo '=== PURCHASE SUMMARY ==='
+        total_purchases=$(logsearch --no-filename 'PURCHASE SUCCESSFUL' "${LOGS[@]}" 2>/dev/null | wc -l)
+        echo "Total successful purchases: $total_purchases"
+        ;;
+
+    portfolio)
+        echo '=== PORTFOLIO PROGRESSION ==='
+        require_logs
+
+        # Get the most recent portfolio summary from each day
+        for logfile in "${LOGS[@]}"; do
+            stamp=${logfile#btc_bot_}
+            stamp=${stamp%.log}
+
+            portfolio=$(logsearch -A 4 'FINAL PORTFOLIO SUMMARY' "$logfile" 2>/dev/null | tail -4)
+            if [ -n "$portfolio" ]; then
+                echo ""
+                echo "📅 ${stamp:0:4}-${stamp:4:2}-${stamp:6:2}:"
+                echo "$portfolio" | sed 's/^/    /'
+            fi
+        done
+        ;;
+
+    stats)
+        # One awk pass over the logs accumulates every counter; deploy.py formats them
+        if [ ${#LOGS[@]} -eq 0 ]; then
+            echo NO_LOGS
+            exit 0
+        fi
+        awk '
+            FNR == 1 && NR > 1 { if (last ~ /Bot execution completed/) completed++ }
+            { last = $0 }
+            /Starting BTC Accumulation Bot/ { runs++ }
+            /PURCHASE SUCCESSFUL/ { succ++ }
+            /PURCHASE FAILED/ { fail++ }
+            /NO PURCHASE TODAY/ { noact++ }
+            match($0, /PERFECT STORM|EXTREME OVERSOLD|UNDERSOLD|OVERBOUGHT|EXTREME BUBBLE/) {
+                sig[substr($0, RSTART, RLENGTH)]++
+            }
+            END {
+                if (last ~ /Bot execution completed/) completed++
+                printf "COUNTS %d %d %d %d %d\n", runs, succ, fail, noact, completed
+                for (k in sig) printf "SIG %d %s\n", sig[k], k
+            }
+        ' "${LOGS[@]}"
+        ;;
+
+    *)
+        echo "❌ Unknown query: $subcommand" >&2
+        echo "Usage: $0 {today|live|tail|yesterday|week|list|search|errors|purchases|portfolio|stats} [args...]" >&2
+        exit 2
+        ;;
+esac
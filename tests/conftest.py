@@ -0,0 +1,6 @@
+from pathlib import Path
+import sys
+
+# btc_bot opens logs/btc_bot_<date>.log relative to the working directory at import time
+Path("logs").mkdir(exist_ok=True)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,87 @@
+"""
+Guards the strategy lookup tables against the original if/elif ladder
+"""
+import math
+import random
+
+import pytest
+
+from btc_bot import _bucket_multiplier, _bucket_signal, _multiplier, _multiplier_vec, _strategy_bucket
+
+MAYER_EDGES = (0.8, 1.0, 1.2, 1.6, 2.4)
+FEAR_GREED_EDGES = (25, 30, 35, 40)
+
+
+def ladder(mayer, fear_greed):
+    """The pre-table calculate_buy_amount logic, kept verbatim as the reference"""
+    multiplier = 1.0
+    if mayer < 0.8 and fear_greed < 25:
+        multiplier = 4.0
+        signal = f"🚀 PERFECT STORM: Mayer {mayer:.3f} + F&G {fear_greed}"
+    elif mayer < 0.8 and fear_greed < 35:
+        multiplier = 3.5
+        signal = f"🔥 EXTREME OVERSOLD + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
+    elif mayer < 0.8:
+        multiplier = 3.0
+        signal = f"🔥 EXTREME OVERSOLD: Mayer {mayer:.3f}"
+    elif mayer < 1.0 and fear_greed < 30:
+        multiplier = 2.5
+        signal = f"💎 UNDERSOLD + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
+    elif mayer < 1.0:
+        multiplier = 1.8
+        signal = f"📈 UNDERSOLD: Mayer {mayer:.3f}"
+    elif mayer < 1.2 and fear_greed < 40:
+        multiplier = 1.2
+        signal = f"⚖️ FAIR VALUE + FEAR: Mayer {mayer:.3f} + F&G {fear_greed}"
+    elif mayer > 2.4:
+        multiplier = 0.0
+        signal = f"🛑 EXTREME BUBBLE: Mayer {mayer:.3f} - STOP buying"
+    elif mayer > 1.6:
+        multiplier = 0.2
+        signal = f"⚠️ OVERBOUGHT: Mayer {mayer:.3f}"
+    else:
+        signal = f"⚖️ FAIR VALUE: Mayer {mayer:.3f}"
+    return multiplier, signal
+
+
+def table(mayer, fear_greed):
+    bucket = _strategy_bucket(mayer, fear_greed)
+    assert _multiplier(mayer, fear_greed) == _bucket_multiplier(bucket)
+    return _bucket_multiplier(bucket), _bucket_signal(bucket, mayer, fear_greed)
+
+
+def boundary_mayers():
+    for edge in MAYER_EDGES:
+        yield math.nextafter(edge, -math.inf)
+        yield edge
+        yield math.nextafter(edge, math.inf)
+
+
+def boundary_fear_greeds():
+    for edge in FEAR_GREED_EDGES:
+        yield from (edge - 1, edge, edge + 1)
+
+
+@pytest.mark.parametrize("mayer", [0.0, *boundary_mayers(), 5.0, math.nan, math.inf])
+@pytest.mark.parametrize("fear_greed", [0, *boundary_fear_greeds(), 100])
+def test_table_matches_ladder_at_boundaries(mayer, fear_greed):
+    assert table(mayer, fear_greed) == ladder(mayer, fear_greed)
+
+
+def test_table_matches_ladder_on_random_inputs():
+    rng = random.Random(20240101)
+    for _ in range(5000):
+        mayer, fear_greed = rng.uniform(0.0, 3.0), rng.randint(0, 100)
+        assert table(mayer, fear_greed) == ladder(mayer, fear_greed), (mayer, fear_greed)
+
+
+def test_vectorised_multiplier_matches_scalar():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(20240102)
+    mayers = [*boundary_mayers(), math.nan, math.inf] + [rng.uniform(0.0, 3.0) for _ in range(1000)]
+    fear_greeds = [rng.randint(0, 100) for _ in mayers]
+    mayers += [1.0] * 14
+    fear_greeds += [0, *boundary_fear_greeds(), 100]
+
+    expected = [_multiplier(mayer, fear_greed) for mayer, fear_greed in zip(mayers, fear_greeds)]
+    assert _multiplier_vec(np.array(mayers), np.array(fear_greeds)).tolist() == expected